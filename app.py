@@ -2,43 +2,23 @@ import streamlit as st
 import os
 import tempfile
 import logging
+import importlib
+import threading
+import time
 from datetime import datetime
 import json
 import re
 from typing import Dict, List, Optional, Tuple
 
-# Third-party imports
-try:
-    from pytubefix import YouTube
-    import pytubefix
-except ImportError:
-    st.error("Please install pytubefix: pip install pytubefix")
-    st.stop()
-
-try:
-    from pydub import AudioSegment
-    from pydub.utils import which
-except ImportError:
-    st.error("Please install pydub: pip install pydub")
-    st.stop()
-
-try:
-    import openai
-except ImportError:
-    st.error("Please install openai: pip install openai")
-    st.stop()
-
-try:
-    from googletrans import Translator
-except ImportError:
-    st.error("Please install googletrans: pip install googletrans==4.0.0rc1")
-    st.stop()
-
-try:
-    from fpdf import FPDF
-except ImportError:
-    st.error("Please install fpdf2: pip install fpdf2")
-    st.stop()
+# Third-party stage dependencies are imported lazily on first use (see
+# lazy_import) so a fresh container can start serving before they load.
+DEPENDENCY_INSTALL_HINTS = {
+    'pytubefix': "Please install pytubefix: pip install pytubefix",
+    'pydub': "Please install pydub: pip install pydub",
+    'openai': "Please install openai: pip install openai",
+    'googletrans': "Please install googletrans: pip install googletrans==4.0.0rc1",
+    'fpdf': "Please install fpdf2: pip install fpdf2",
+}
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -58,9 +38,139 @@ SUPPORTED_LANGUAGES = {
     'Arabic': 'ar'
 }
 
+def _read_startup_budget(default: float = 5.0) -> float:
+    """Read the startup budget (seconds) from STARTUP_BUDGET_SECONDS, falling back on bad values"""
+    raw = os.environ.get('STARTUP_BUDGET_SECONDS')
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning(f"Invalid STARTUP_BUDGET_SECONDS={raw!r}, using {default:.1f}s")
+        return default
+
+# Startup budget (seconds) for time-to-first-render, measured from process start
+STARTUP_BUDGET_SECONDS = _read_startup_budget()
+
+def process_age_seconds() -> Optional[float]:
+    """Seconds since this process was created, from /proc (None where unavailable)"""
+    try:
+        with open('/proc/self/stat') as f:
+            # Fields after the parenthesised command name; starttime is field 22
+            fields = f.read().rsplit(')', 1)[1].split()
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return uptime - int(fields[19]) / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError):
+        return None
+
+def lazy_import(module_name: str):
+    """Import a stage dependency on first use, stopping the app if it is missing"""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        st.error(DEPENDENCY_INSTALL_HINTS.get(module_name, f"Please install {module_name}"))
+        st.stop()
+
+class ResourceWarmup:
+    """One-time background warm-up of heavy imports, the ffmpeg lookup and the OpenAI client"""
+
+    def __init__(self, openai_api_key: Optional[str] = None):
+        self.timings: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self.pydub_missing = False
+        self.ffmpeg_missing = False
+        self.openai_api_key = openai_api_key
+        self.openai_client = None
+        self.ready_seconds: Optional[float] = None
+        self.first_render_seconds: Optional[float] = None
+        self._done = threading.Event()
+
+    def start(self):
+        """Run the warm-up in a daemon thread so the first page render is not blocked"""
+        threading.Thread(target=self._run, name="resource-warmup", daemon=True).start()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def record_first_render(self):
+        """Record the process age when the page first became usable (once per process)"""
+        if self.first_render_seconds is not None:
+            return
+        self.first_render_seconds = process_age_seconds()
+        if self.first_render_seconds is None:
+            logger.info("Process start time unavailable; startup time not measured")
+        elif self.first_render_seconds <= STARTUP_BUDGET_SECONDS:
+            logger.info(f"First render {self.first_render_seconds:.2f}s after process start (budget {STARTUP_BUDGET_SECONDS:.2f}s)")
+        else:
+            logger.warning(f"First render {self.first_render_seconds:.2f}s after process start, over the {STARTUP_BUDGET_SECONDS:.2f}s budget")
+
+    def _step(self, name: str, func):
+        started = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            logger.warning(f"Warm-up step '{name}' failed: {str(e)}")
+            self.errors[name] = str(e)
+        self.timings[name] = time.perf_counter() - started
+
+    def _run(self):
+        self._step('ffmpeg', self._warm_ffmpeg)
+        self._step('googletrans', lambda: importlib.import_module('googletrans'))
+        self._step('pytubefix', lambda: importlib.import_module('pytubefix'))
+        self._step('openai', self._warm_openai_client)
+        # fpdf2 (>= 2.7) defines the core font metrics at import time in fpdf.fonts
+        self._step('fpdf', lambda: importlib.import_module('fpdf'))
+
+        self.ready_seconds = process_age_seconds()
+        if self.ready_seconds is not None:
+            logger.info(f"Warm-up finished {self.ready_seconds:.2f}s after process start")
+        self._done.set()
+
+    def _warm_ffmpeg(self):
+        try:
+            utils = importlib.import_module('pydub.utils')
+            importlib.import_module('pydub')
+        except ImportError:
+            self.pydub_missing = True
+            raise
+        # Locate ffmpeg once so a missing binary is reported before processing
+        if not utils.which("ffmpeg"):
+            self.ffmpeg_missing = True
+            raise RuntimeError("ffmpeg not found on PATH")
+
+    def _warm_openai_client(self):
+        openai = importlib.import_module('openai')
+        if self.openai_api_key:
+            self.openai_client = openai.OpenAI(api_key=self.openai_api_key)
+
+@st.cache_resource(show_spinner=False)
+def get_warmup() -> ResourceWarmup:
+    """Start the process-wide warm-up exactly once"""
+    try:
+        openai_api_key = st.secrets["OPENAI_API_KEY"]
+    except (KeyError, FileNotFoundError):
+        openai_api_key = None  # main() reports the missing key
+    warmup = ResourceWarmup(openai_api_key=openai_api_key)
+    warmup.start()
+    return warmup
+
+@st.cache_resource(show_spinner=False)
+def get_openai_client(api_key: str):
+    """Return a reusable OpenAI client, preferring the one built during warm-up"""
+    warmup = get_warmup()
+    if warmup.openai_client is not None and warmup.openai_api_key == api_key:
+        return warmup.openai_client
+    return lazy_import('openai').OpenAI(api_key=api_key)
+
 class VideoProcessor:
-    def __init__(self):
-        self.translator = Translator()
+    @property
+    def translator(self):
+        # googletrans' Translator holds mutable HTTP/token state, so keep one per session
+        if 'translator' not in st.session_state:
+            st.session_state.translator = lazy_import('googletrans').Translator()
+        return st.session_state.translator
         
     def validate_url(self, url: str) -> Tuple[bool, str]:
         """Validate if the URL is from supported platforms"""
@@ -93,6 +203,8 @@ class VideoProcessor:
                 # Handle other YouTube URL formats
                 return False, "Invalid YouTube URL format. Please use: https://www.youtube.com/watch?v=VIDEO_ID", {}
             
+            YouTube = lazy_import('pytubefix').YouTube
+            
             # Try multiple approaches with different configurations
             for attempt in range(3):
                 try:
@@ -206,7 +318,7 @@ class VideoProcessor:
                 logger.info("Converting to MP3 format...")
                 
                 # Load the downloaded file
-                audio = AudioSegment.from_file(temp_file)
+                audio = lazy_import('pydub').AudioSegment.from_file(temp_file)
                 
                 # Create MP3 file path
                 mp3_file = os.path.join(output_path, "audio.mp3")
@@ -246,12 +358,11 @@ class VideoProcessor:
         try:
             logger.info(f"Transcribing audio: {audio_path}")
             
-            # Set OpenAI API key
-            openai.api_key = openai_api_key
+            client = get_openai_client(openai_api_key)
             
             # Open and transcribe audio file
             with open(audio_path, "rb") as audio_file:
-                transcript = openai.audio.transcriptions.create(
+                transcript = client.audio.transcriptions.create(
                     model="whisper-1",
                     file=audio_file,
                     response_format="text"
@@ -305,6 +416,7 @@ class VideoProcessor:
         """Generate PDF report with all processed data"""
         try:
             logger.info("Generating PDF report")
+            FPDF = lazy_import('fpdf').FPDF
             
             class PDF(FPDF):
                 def header(self):
@@ -385,6 +497,33 @@ class VideoProcessor:
             logger.error(f"Error generating PDF: {str(e)}")
             return False, f"PDF generation failed: {str(e)}"
 
+@st.cache_resource(show_spinner=False)
+def get_processor() -> VideoProcessor:
+    """Return the shared processor instance"""
+    return VideoProcessor()
+
+def render_startup_metrics(warmup: ResourceWarmup):
+    """Show startup timings, measured from process start, against the budget"""
+    if warmup.first_render_seconds is None:
+        st.caption("Process start time unavailable on this platform")
+        return
+    
+    st.metric(
+        "Time to first render",
+        f"{warmup.first_render_seconds:.2f}s",
+        delta=f"{warmup.first_render_seconds - STARTUP_BUDGET_SECONDS:+.2f}s vs {STARTUP_BUDGET_SECONDS:.1f}s budget",
+        delta_color="inverse"
+    )
+    if warmup.done:
+        if warmup.ready_seconds is not None:
+            st.metric("Resources warm", f"{warmup.ready_seconds:.2f}s")
+        with st.expander("Warm-up details", expanded=False):
+            for name, seconds in warmup.timings.items():
+                status = f" ⚠️ {warmup.errors[name]}" if name in warmup.errors else ""
+                st.write(f"**{name}:** {seconds:.2f}s{status}")
+    else:
+        st.caption("Warming up resources in the background...")
+
 # Streamlit App
 def main():
     st.set_page_config(
@@ -400,8 +539,9 @@ def main():
     if 'favorites' not in st.session_state:
         st.session_state.favorites = []
     
-    # Initialize processor
-    processor = VideoProcessor()
+    # Reuse the process-wide processor; heavy resources warm up in the background
+    warmup = get_warmup()
+    processor = get_processor()
     
     # Get OpenAI API key from Streamlit secrets
     try:
@@ -433,6 +573,11 @@ def main():
         st.markdown("- ❌ Facebook (API required)")
         st.markdown("- ❌ TikTok (API required)")
         
+        st.markdown("---")
+        st.markdown("### ⏱️ Startup")
+        # Filled in once the inputs below are drawn and the page is usable
+        startup_panel = st.empty()
+        
         st.markdown("---")
         st.markdown("### 🧪 Test Videos")
         st.markdown("If you're having issues, try these:")
@@ -471,11 +616,24 @@ def main():
         # Process button
         process_button = st.button("🚀 Process", type="primary")
         
+        # The inputs are on screen now, so this run has made the page usable
+        warmup.record_first_render()
+        with startup_panel.container():
+            render_startup_metrics(warmup)
+        
         if process_button and (video_url or uploaded_file):
             if not video_url and not uploaded_file:
                 st.error("Please provide either a video URL or upload a file")
                 return
             
+            if warmup.pydub_missing:
+                st.error(DEPENDENCY_INSTALL_HINTS['pydub'])
+                return
+            
+            if warmup.ffmpeg_missing:
+                st.error("❌ ffmpeg was not found on this server, so audio cannot be converted. Please install ffmpeg and restart the app.")
+                return
+            
             # Processing steps
             with st.spinner("Processing..."):
                 progress_bar = st.progress(0)
@@ -497,7 +655,7 @@ def main():
                         
                         # Convert to MP3 if needed
                         try:
-                            audio = AudioSegment.from_file(temp_input_path)
+                            audio = lazy_import('pydub').AudioSegment.from_file(temp_input_path)
                             mp3_file = os.path.join(temp_dir, "audio.mp3")
                             audio.export(
                                 mp3_file, 